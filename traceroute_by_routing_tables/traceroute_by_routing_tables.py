@@ -1,7 +1,12 @@
 
 import os
 import re
+import sys
+import mmap
+import json
 import pytricia
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from time import time
 
 
@@ -9,46 +14,46 @@ from time import time
 # Each routing table MUST be in a separate .txt file.
 RT_DIRECTORY = "./routing_tables"
 
-# RegEx template string for IPv4 address matching.
-REGEXP_IPv4_STR = (
-    r'((25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.'
-    + r'(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.'
-    + r'(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.'
-    + r'(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?))'
-)
+# Number of worker processes parsing routing table files in parallel.
+# None means number of CPUs. Set to 1 to parse in the main process only.
+PARSE_WORKERS = None
+
+# Number of threads reading routing table files concurrently
+# when files are parsed in the main process.
+FILE_READ_WORKERS = 8
 
-# IPv4 CIDR notation matching in user input.
-REGEXP_INPUT_IPv4 = re.compile(r"^" + REGEXP_IPv4_STR + r"(\/\d\d?)?$")
+# Path to the JSON file with cached parse results of routing table files.
+# Unchanged files (same mtime and size) are loaded from it instead of parsing,
+# including files which failed to parse.
+# Set to None to disable caching.
+PARSE_CACHE_FILE = "./.routetables.cache"
+
+# Parse cache format version.
+# MUST be incremented on any change of 'router' object format.
+PARSE_CACHE_VERSION = 4
+
+# RegEx template string for IPv4 address matching.
+# Octet values are not range checked here.
+REGEXP_IPv4_STR = r'[0-9]{1,3}(?:\.[0-9]{1,3}){3}'
 
 # Local and Connected route strings matching.
 REGEXP_ROUTE_LOCAL_CONNECTED = re.compile(
-    r'^(?P<routeType>[L|C])\s+'
-    + r'((?P<ipaddress>\d\d?\d?\.\d\d?\d?\.\d\d?\d?\.\d\d?\d?)'
+    r'^(?P<routeType>[LC])\s+'
+    + r'(?P<ipaddress>' + REGEXP_IPv4_STR + r')'
     + r'\s?'
-    + r'(?P<maskOrPrefixLength>(\/\d\d?)?'
-    + r'|(\d\d?\d?\.\d\d?\d?\.\d\d?\d?\.\d\d?\d?)?))'
-    + r'\ is\ directly\ connected\,\ '
-    + r'(?P<interface>\S+)',
-    re.MULTILINE
+    + r'(?P<maskOrPrefixLength>/[0-9]{1,2}|' + REGEXP_IPv4_STR + r')?'
+    + r' is directly connected, '
+    + r'(?P<interface>\S+)'
 )
 
-# Static and dynamic route strings matching.
-REGEXP_ROUTE = re.compile(
-    r'^(\S\S?\*?\s?\S?\S?)'
-    + r'\s+'
-    + r'((?P<subnet>\d\d?\d?\.\d\d?\d?\.\d\d?\d?\.\d\d?\d?)'
-    + r'\s?'
-    + r'(?P<maskOrPrefixLength>(\/\d\d?)?'
-    + r'|(\d\d?\d?\.\d\d?\d?\.\d\d?\d?\.\d\d?\d?)?))'
-    + r'\s*'
-    + r'(?P<viaPortion>(?:\n?\s+(\[\d\d?\d?\/\d+\])\s+'
-    + r'via\s+(\d\d?\d?\.\d\d?\d?\.\d\d?\d?\.\d\d?\d?)(.*)\n?)+)',
-    re.MULTILINE
-)
+# Number of set bits for every possible octet value.
+# Used for subnet mask to prefix length conversion.
+_POPCOUNT = bytes(bin(i).count("1") for i in range(256))
 
-# Route string VIA portion matching.
-REGEXP_VIA_PORTION = re.compile(
-    r'.*via\s+(\d\d?\d?\.\d\d?\d?\.\d\d?\d?\.\d\d?\d?).*'
+# Interface name prefixes used as next-hop in Connected and Local route strings.
+_IFACE_PREFIXES = (
+    'Eth', 'Fast', 'Gig', 'Ten', 'Port',
+    'Serial', 'Vlan', 'Tunn', 'Loop', 'Null'
 )
 
 
@@ -56,11 +61,13 @@ REGEXP_VIA_PORTION = re.compile(
 # Each file is represented by a single 'router' object.
 # Router is referenced by Router ID (RID).
 # RID is filename by default.
+# Router object is its PyTricia routing table.
+# Local interfaces are stored in GLOBAL_INTERFACE_TREE instead.
 # Format:
 #
 # ROUTERS = {
-#     'RID1': {'routing_table': {}, 'interface_list': ()},
-#     'RID_N': {'routing_table': {}, 'interface_list': ()},
+#     'RID1': routing_table,
+#     'RID_N': routing_table,
 # }
 #
 ROUTERS = {}
@@ -71,100 +78,208 @@ ROUTERS = {}
 # Interface IP addresses SHOULD be globally unique across the inspected topology.
 GLOBAL_INTERFACE_TREE = pytricia.PyTricia()
 
+# Path search cache shared by all user searches.
+# Stores loop-free paths found by trace_route for each RID and target.
+# MUST be cleared whenever ROUTERS is reloaded.
+# Format:
+#
+# TRACE_CACHE = {
+#     ('RID1', 'target_subnet'): [path_1, path_N],
+# }
+#
+TRACE_CACHE = {}
+
 
-def parse_show_ip_route_ios_like(raw_routing_table):
+def parse_show_ip_route_ios_like(raw_routing_table, router_id,
+                                 interface_tree=None):
     """
     Parser for routing table text output.
     Compatible with both Cisco IOS(IOS-XE) 'show ip route'
     and Cisco ASA 'show route' output format.
     Processes input text file and write into Python data structures.
+    Input text is processed line by line in a single pass.
     Builds internal PyTricia search tree in 'route_tree'.
-    Generates local interface list for a router in 'interface_list'
-    Returns 'router' dictionary object with parsed data.
+    Adds local interfaces of the router to 'interface_tree'
+    (GLOBAL_INTERFACE_TREE by default) under passed Router ID (RID).
+    Returns 'router' object with parsed data
+    or None if no routing table entries were found.
     """
-    router = {}
+    if interface_tree is None:
+        interface_tree = GLOBAL_INTERFACE_TREE
     route_tree = pytricia.PyTricia()
-    interface_list = []
-    # Parse Local and Connected route strings in text.
-    for raw_route_string in REGEXP_ROUTE_LOCAL_CONNECTED.finditer(raw_routing_table):
-        subnet = (
-            raw_route_string.group('ipaddress')
-            + convert_netmask_to_prefix_length(
-                raw_route_string.group('maskOrPrefixLength')
+    # Routes are buffered and inserted into 'route_tree' in one pass
+    # once the text is parsed.
+    pending_routes = []
+    local_interface_count = 0
+    lines = raw_routing_table.splitlines()
+    # Tokenize every line exactly once before assembling route strings.
+    parsed_lines = list(map(_parse_line, lines))
+    line_count = len(lines)
+    index = 0
+    while index < line_count:
+        first_index = index
+        parsed_line = parsed_lines[index]
+        index += 1
+        if not parsed_line or parsed_line[0] == 'V':
+            continue
+        kind, subnet, mask, nexthop_or_iface = parsed_line
+        subnet += convert_netmask_to_prefix_length(mask)
+        # Local and Connected route strings.
+        if kind in ('L', 'C'):
+            pending_routes.append(
+                (subnet, ((nexthop_or_iface,), lines[first_index]))
             )
-        )
-        interface = raw_route_string.group('interface')
-        route_tree[subnet] = ((interface,), raw_route_string.group(0))
-        if raw_route_string.group('routeType') == 'L':
-            interface_list.append((interface, subnet,))
-    if not interface_list:
-        print('Failed to find routing table entries in given output')
+            if kind == 'L':
+                interface_tree[subnet] = (router_id, nexthop_or_iface,)
+                local_interface_count += 1
+            continue
+        # Static and dynamic route strings.
+        # Collect next-hops from the following VIA continuation lines.
+        next_hops = [nexthop_or_iface] if nexthop_or_iface else []
+        while index < line_count:
+            parsed_line = parsed_lines[index]
+            if not parsed_line or parsed_line[0] != 'V':
+                break
+            next_hops.append(parsed_line[3])
+            index += 1
+        if next_hops:
+            pending_routes.append((subnet, (
+                tuple(next_hops), '\n'.join(lines[first_index:index])
+            )))
+    if not local_interface_count:
+        return None
+    for subnet, route in pending_routes:
+        route_tree[subnet] = route
+    return route_tree
+
+
+def _parse_line(line):
+    """
+    Single routing table text line tokenizer.
+    Returns (kind, subnet, mask, nexthop_or_iface) tuple where kind is:
+      'L' or 'C' for Local and Connected route strings,
+      'R' for static and dynamic route strings,
+      'V' for VIA continuation lines of a multi-line route string.
+    Returns None for any other line (headers, codes legend, etc.).
+    Interface names and next-hops repeat across many route strings,
+    so they are interned to share a single string object.
+    """
+    if not line:
         return None
-    # parse static and dynamic route strings in text
-    for raw_route_string in REGEXP_ROUTE.finditer(raw_routing_table):
-        subnet = (
-            raw_route_string.group('subnet')
-            + convert_netmask_to_prefix_length(
-                raw_route_string.group('maskOrPrefixLength')
+    if line[0] in 'LC':
+        raw_route_string = REGEXP_ROUTE_LOCAL_CONNECTED.match(line)
+        if raw_route_string:
+            return (
+                raw_route_string.group('routeType'),
+                raw_route_string.group('ipaddress'),
+                raw_route_string.group('maskOrPrefixLength'),
+                sys.intern(raw_route_string.group('interface')),
             )
-        )
-        via_portion = raw_route_string.group('viaPortion')
-        next_hops = []
-        if via_portion.count('via') > 1:
-            for line in via_portion.splitlines():
-                if line:
-                    next_hops.append(REGEXP_VIA_PORTION.match(line).group(1))
-        else:
-            next_hops.append(REGEXP_VIA_PORTION.match(via_portion).group(1))
-        route_tree[subnet] = (next_hops, raw_route_string.group(0))
-    router = {
-        'routing_table': route_tree,
-        'interface_list': interface_list,
-    }
-    return router
+    tokens = line.split()
+    if not tokens:
+        return None
+    # VIA continuation line: '[AD/Metric] via NEXTHOP, ...'
+    if line[0].isspace():
+        if tokens[0][0] == '[':
+            next_hop = _parse_via_tokens(tokens)
+            if next_hop:
+                return ('V', None, None, next_hop)
+        return None
+    # Route code takes one or two tokens, e.g. 'S', 'S*', 'D EX', 'O E2'.
+    for position in (1, 2):
+        if position < len(tokens) and _is_ipv4_token(
+            tokens[position].partition('/')[0]
+        ):
+            break
+    else:
+        return None
+    subnet, _, prefix_length = tokens[position].partition('/')
+    mask = '/' + prefix_length if prefix_length else ''
+    position += 1
+    # Cisco ASA format: subnet followed by dotted subnet mask.
+    if not mask and position < len(tokens) and _is_ipv4_token(tokens[position]):
+        mask = tokens[position]
+        position += 1
+    tokens = tokens[position:]
+    # VIA portion is on the next line(s).
+    if not tokens:
+        return ('R', subnet, mask, None)
+    next_hop = _parse_via_tokens(tokens)
+    if next_hop:
+        return ('R', subnet, mask, next_hop)
+    return None
+
+
+def _parse_via_tokens(tokens):
+    """
+    Gets route string tokens starting with '[AD/Metric]'.
+    Returns next-hop IP address following 'via' or None.
+    """
+    if len(tokens) > 2 and tokens[0][0] == '[' and tokens[1] == 'via':
+        next_hop = tokens[2].rstrip(',')
+        if _is_ipv4_token(next_hop):
+            return sys.intern(next_hop)
+
+
+def _is_ipv4_token(token):
+    """Check if token looks like a dotted-quad IPv4 address."""
+    octets = token.split('.')
+    return len(octets) == 4 and all(octet.isdigit() for octet in octets)
 
 
-def parse_text_routing_table(raw_routing_table):
+def parse_text_routing_table(raw_routing_table, router_id, interface_tree=None):
     """
     Parser functions wrapper.
     Add additional parsers for alternative routing table syntaxes here.
     """
-    router = parse_show_ip_route_ios_like(raw_routing_table)
+    router = parse_show_ip_route_ios_like(
+        raw_routing_table, router_id, interface_tree
+    )
     if router:
         return router
 
 
+@lru_cache(maxsize=128)
 def convert_netmask_to_prefix_length(mask_or_pref):
     """
     Gets subnet_mask (XXX.XXX.XXX.XXX) of /prefix_length (/XX).
     For subnet_mask, converts it to /prefix_length and returns the result.
     For /prefix_length, returns as is.
     For empty input, returns "" string.
+    Results are cached, as real routing tables use just a few distinct masks.
     """
     if not mask_or_pref:
         return ""
-    if re.match(r"^\/\d\d?$", mask_or_pref):
+    if mask_or_pref[0] == "/":
         return mask_or_pref
-    if re.match(r"^\d\d?\d?\.\d\d?\d?\.\d\d?\d?\.\d\d?\d?$",
-                mask_or_pref):
-        return (
-            "/"
-            + str(sum([bin(int(x)).count("1") for x in mask_or_pref.split(".")]))
+    try:
+        a, b, c, d = mask_or_pref.split(".")
+        return "/" + str(
+            _POPCOUNT[int(a)] + _POPCOUNT[int(b)]
+            + _POPCOUNT[int(c)] + _POPCOUNT[int(d)]
         )
-    return ""
+    except (ValueError, IndexError):
+        return ""
 
 
 def route_lookup(destination, router):
     """
     Performs route_tree lookup in passed router object
     for passed destination subnet.
-    Returns list of next_hops with original route strings or (None, None)
+    Returns tuple of next_hops with original route strings or (None, None)
     depending on the lookup result.
     """
-    if destination in router['routing_table']:
-        return router['routing_table'][destination]
-    else:
-        return (None, None)
+    return router.get(destination, (None, None))
+
+
+@lru_cache(maxsize=4096)
+def route_lookup_by_rid(router_id, destination):
+    """
+    Cached route_lookup() in router object referenced by Router ID (RID).
+    Cache MUST be cleared with route_lookup_by_rid.cache_clear()
+    whenever ROUTERS is reloaded.
+    """
+    return route_lookup(destination, ROUTERS[router_id])
 
 
 def get_rid_by_interface_ip(interface_ip):
@@ -178,43 +293,331 @@ def nexthop_is_local(next_hop):
     Check if next-hop points to the local interface.
     Will be True for Connected and Local route strings on Cisco devices.
     """
-    interface_types = (
-        'Eth', 'Fast', 'Gig', 'Ten', 'Port',
-        'Serial', 'Vlan', 'Tunn', 'Loop', 'Null'
-    )
-    for type in interface_types:
-        if next_hop.startswith(type):
-            return True
+    return next_hop.startswith(_IFACE_PREFIXES)
 
 
-def trace_route(source_router_id, target_ip, path=[]):
+def trace_route(source_router_id, target_ip, cache=None):
     """
-    Performs recursive path search from source Router ID (RID) to the target subnet.
+    Performs path search from source Router ID (RID) to the target subnet.
     Returns tuple of path tuples.
     Each path tuple contains a sequence of Router IDs with matched route strings.
     Multiple paths are supported.
+    Optional 'cache' dictionary keeps loop-free path suffixes found
+    for each transit RID. Share it between searches for the same target
+    to avoid repeated path search from the same transit routers.
+    Search is iterative over an explicit stack of transit routers,
+    so path length is not limited by Python recursion depth.
     """
-    if not source_router_id:
-        return [path + [(None, None)]]
-    current_router = ROUTERS[source_router_id]
-    next_hop, raw_route_string = route_lookup(target_ip, current_router)
-    path = path + [(source_router_id, raw_route_string)]
-    paths = []
-    if next_hop:
-        if nexthop_is_local(next_hop[0]):
-            return [path]
-        for nh in next_hop:
-            next_hop_rid = get_rid_by_interface_ip(nh)
-            if next_hop_rid not in [r[0] for r in path]:
-                inner_path = trace_route(next_hop_rid, target_ip, path)
-                for p in inner_path:
-                    paths.append(p)
+    if cache is None:
+        cache = {}
+    stack = []
+    step = _trace_route_hop(source_router_id, target_ip, frozenset(), cache)
+    while True:
+        if isinstance(step, _TraceFrame):
+            # Transit router, its next-hops are followed below.
+            stack.append(step)
+        else:
+            # Paths from the router are known, pass them to the previous hop.
+            paths, is_loop_free = step
+            if not stack:
+                return paths
+            stack[-1].add_paths(paths, is_loop_free)
+        frame = stack[-1]
+        next_hop = next(frame.next_hops, None)
+        if next_hop is None:
+            # All next-hops are processed.
+            stack.pop()
+            # Loop-free results do not depend on 'visited'.
+            if frame.is_loop_free:
+                cache[frame.key] = frame.paths
+            step = (frame.paths, frame.is_loop_free)
+            continue
+        router_id = get_rid_by_interface_ip(next_hop)
+        if router_id in frame.visited:
+            # Paths found via other next-hops are dropped on a loop.
+            stack.pop()
+            step = (
+                [frame.hop + ((router_id+"<<LOOP DETECTED", None),)], False
+            )
+            continue
+        step = _trace_route_hop(router_id, target_ip, frame.visited, cache)
+
+
+def _trace_route_hop(router_id, target_ip, visited, cache):
+    """
+    Path search step for trace_route.
+    Returns (paths, is_loop_free) tuple if paths from passed Router ID (RID)
+    are known without following its next-hops.
+    Otherwise, returns a new _TraceFrame for the RID.
+    """
+    if not router_id:
+        return [((None, None),)], True
+    key = (router_id, target_ip)
+    if key in cache:
+        return cache[key], True
+    next_hop, raw_route_string = route_lookup_by_rid(router_id, target_ip)
+    hop = ((router_id, raw_route_string),)
+    if not next_hop or nexthop_is_local(next_hop[0]):
+        cache[key] = [hop]
+        return cache[key], True
+    return _TraceFrame(key, hop, iter(next_hop), visited | {router_id})
+
+
+class _TraceFrame:
+    """
+    Path search state of a transit router in trace_route.
+    'visited' is a set of RIDs present on the path up to this router,
+    including it. 'paths' collects paths found via processed next-hops.
+    """
+    __slots__ = (
+        'key', 'hop', 'next_hops', 'visited', 'paths', 'is_loop_free'
+    )
+
+    def __init__(self, key, hop, next_hops, visited):
+        self.key = key
+        self.hop = hop
+        self.next_hops = next_hops
+        self.visited = visited
+        self.paths = []
+        self.is_loop_free = True
+
+    def add_paths(self, paths, is_loop_free):
+        """Adds paths found via the current next-hop."""
+        self.paths.extend(self.hop + p for p in paths)
+        self.is_loop_free = self.is_loop_free and is_loop_free
+
+
+def read_routing_table_file(path):
+    """
+    Reads routing table file in binary mode and returns its text.
+    The file is memory-mapped and decoded straight from the mapping,
+    without an intermediate bytes copy.
+    Routing table output is plain ASCII, so Latin-1 decoding is used
+    as the cheapest one that never fails.
+    """
+    with open(path, 'rb') as f:
+        # Empty files can not be mapped.
+        if not os.fstat(f.fileno()).st_size:
+            return ''
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return str(mm, 'latin-1')
+
+
+def parse_routing_table_with_interfaces(raw_routing_table, router_id):
+    """
+    Parses routing table text without touching GLOBAL_INTERFACE_TREE.
+    Returns (router, interfaces) tuple or None on failure.
+    'interfaces' is a tuple of (interface_ip, interface) pairs
+    found in this routing table.
+    """
+    interface_tree = {}
+    router = parse_text_routing_table(
+        raw_routing_table, router_id, interface_tree
+    )
+    if router:
+        return (
+            router,
+            tuple(
+                (addr, iface) for addr, (_, iface) in interface_tree.items()
+            ),
+        )
+
+
+def parse_routing_table_file(path, router_id):
+    """
+    Reads and parses a single routing table file.
+    Worker process entry point, so the result is picklable:
+    returns (serialized_router, interfaces) tuple or None on failure.
+    """
+    parse_result = parse_routing_table_with_interfaces(
+        read_routing_table_file(path), router_id
+    )
+    if parse_result:
+        router, interfaces = parse_result
+        return serialize_router(router), interfaces
+
+
+def get_parse_worker_count(file_count):
+    """Returns number of worker processes for parsing passed number of files."""
+    return min(PARSE_WORKERS or os.cpu_count() or 1, file_count)
+
+
+def parse_routing_table_files(paths, router_ids, workers):
+    """
+    Parses passed routing table files.
+    Yields (router, interfaces) tuple or None for each file in the same order.
+    Local interfaces are not added to GLOBAL_INTERFACE_TREE here.
+    With several workers, files are parsed in parallel by worker processes,
+    which are shut down once all files are parsed.
+    Otherwise, files are read in background threads
+    and parsed in the main process.
+    """
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parse_results = list(executor.map(
+                parse_routing_table_file, paths, router_ids
+            ))
+        for parse_result in parse_results:
+            if parse_result:
+                serialized_router, interfaces = parse_result
+                yield deserialize_router(serialized_router), interfaces
             else:
-                path = path + [(next_hop_rid+"<<LOOP DETECTED", None)]
-                return [path]
+                yield None
     else:
-        return [path]
-    return paths
+        # Read files in background threads while parsing the ones already read.
+        with ThreadPoolExecutor(max_workers=FILE_READ_WORKERS) as executor:
+            raw_tables = executor.map(read_routing_table_file, paths)
+            for router_id, raw_table in zip(router_ids, raw_tables):
+                yield parse_routing_table_with_interfaces(raw_table, router_id)
+
+
+def load_parse_cache(cache_file):
+    """
+    Loads parse cache from passed JSON file.
+    Returns dictionary of cached routers keyed by file path:
+    {path: ((st_mtime_ns, st_size), serialized_router, interfaces)}
+    where 'interfaces' is a tuple of (interface_ip, interface) pairs.
+    'serialized_router' is None for files which failed to parse.
+    Returns empty dictionary if cache is missing, corrupted or outdated.
+    """
+    if not cache_file or not os.path.isfile(cache_file):
+        return {}
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            version, parse_cache = json.load(f)
+        if version != PARSE_CACHE_VERSION:
+            return {}
+        return {
+            path: _decode_parse_cache_entry(*entry)
+            for path, entry in parse_cache.items()
+        }
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {}
+
+
+def _decode_parse_cache_entry(file_key, serialized_router, interfaces):
+    """
+    Converts parse cache entry loaded from JSON back to tuples.
+    JSON has no tuples, so all of them are loaded as lists.
+    """
+    if serialized_router is not None:
+        serialized_router = [
+            (subnet, (tuple(map(sys.intern, next_hops)), raw_route_string))
+            for subnet, (next_hops, raw_route_string) in serialized_router
+        ]
+    mtime_ns, size = file_key
+    return (
+        (mtime_ns, size),
+        serialized_router,
+        tuple((addr, sys.intern(iface)) for addr, iface in interfaces),
+    )
+
+
+def save_parse_cache(cache_file, parse_cache):
+    """Saves parse cache dictionary into passed JSON file."""
+    if not cache_file:
+        return
+    try:
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump((PARSE_CACHE_VERSION, parse_cache), f)
+    except OSError as e:
+        print("Failed to save parse cache to {}: {}".format(cache_file, e))
+
+
+def serialize_router(router):
+    """
+    Converts 'router' object into picklable and JSON serializable form.
+    PyTricia trees are not picklable, so routing table is stored
+    as a list of (subnet, route) pairs.
+    """
+    return [(subnet, router[subnet]) for subnet in router]
+
+
+def deserialize_router(serialized_router):
+    """Rebuilds 'router' object from serialize_router() output."""
+    route_tree = pytricia.PyTricia()
+    for subnet, route in serialized_router:
+        route_tree[subnet] = route
+    return route_tree
+
+
+def restore_router(serialized_router, interfaces):
+    """
+    Rebuilds (router, interfaces) tuple from parse cache entry.
+    Returns None for a file which failed to parse.
+    Raises ValueError or TypeError for malformed subnets or interface IPs.
+    """
+    if serialized_router is None:
+        return None
+    # Check interface IPs before they are added to GLOBAL_INTERFACE_TREE.
+    interface_tree = pytricia.PyTricia()
+    for addr, iface in interfaces:
+        interface_tree[addr] = iface
+    return deserialize_router(serialized_router), interfaces
+
+
+def register_interfaces(interfaces, router_id):
+    """Adds local interfaces of the router to GLOBAL_INTERFACE_TREE."""
+    for addr, iface in interfaces:
+        GLOBAL_INTERFACE_TREE[addr] = (router_id, iface,)
+
+
+def build_parse_cache(entries, file_keys, routers, interfaces_by_rid,
+                      parse_cache):
+    """
+    Builds parse cache dictionary for all passed files.
+    Files which failed to parse are stored with None instead of router,
+    so they are not parsed again until changed.
+    Serialized routers of unchanged files are reused from old 'parse_cache'.
+    Local interfaces are taken as found in each file,
+    as GLOBAL_INTERFACE_TREE keeps only the last router for shared addresses.
+    """
+    new_parse_cache = {}
+    for entry in entries:
+        router_id = entry.name.replace('.txt', '')
+        cached = parse_cache.get(entry.path)
+        if cached and cached[0] == file_keys[entry.path]:
+            serialized_router = cached[1]
+        elif router_id in routers:
+            serialized_router = serialize_router(routers[router_id])
+        else:
+            serialized_router = None
+        new_parse_cache[entry.path] = (
+            file_keys[entry.path],
+            serialized_router,
+            interfaces_by_rid.get(router_id, ()),
+        )
+    return new_parse_cache
+
+
+def is_valid_ipv4_cidr(address):
+    """
+    Check if address is an IPv4 address or subnet in CIDR notation.
+    Accepts A.B.C.D and A.B.C.D/NN formats.
+    Only ASCII digits are allowed. Octets MUST NOT have leading zeros.
+    Signs and whitespace inside the address are not allowed.
+    """
+    ip, slash, prefix_length = address.partition('/')
+    octets = ip.split('.')
+    if len(octets) != 4:
+        return False
+    for octet in octets:
+        if not _is_ascii_number(octet, 3) or int(octet) > 255:
+            return False
+        if len(octet) > 1 and octet[0] == '0':
+            return False
+    if slash and not (
+        _is_ascii_number(prefix_length, 2) and int(prefix_length) <= 32
+    ):
+        return False
+    return True
+
+
+def _is_ascii_number(token, max_length):
+    """Check if token is a non-empty string of up to max_length ASCII digits."""
+    return (
+        0 < len(token) <= max_length and token.isascii() and token.isdigit()
+    )
 
 
 def do_parse_directory(rt_directory):
@@ -226,6 +629,8 @@ def do_parse_directory(rt_directory):
     Return new_routers.
     """
     new_routers = {}
+    # Local interfaces found in each routing table file, keyed by RID.
+    interfaces_by_rid = {}
     if not os.path.isdir(rt_directory):
         print(
             "{} directory does not exist.".format(rt_directory)
@@ -234,39 +639,92 @@ def do_parse_directory(rt_directory):
         return None
     start_time = time()
     print("Initializing files...")
-    for FILENAME in os.listdir(rt_directory):
-        if FILENAME.endswith('.txt'):
-            file_init_start_time = time()
-            with open(os.path.join(rt_directory, FILENAME), 'r') as f:
-                print('Opening {}'.format(FILENAME))
-                raw_table = f.read()
-                new_router = parse_text_routing_table(raw_table)
-                router_id = FILENAME.replace('.txt', '')
-                if new_router:
-                    new_routers[router_id] = new_router
-                    if new_router['interface_list']:
-                        for iface, addr in new_router['interface_list']:
-                            GLOBAL_INTERFACE_TREE[addr] = (router_id, iface,)
-                else:
-                    print('Failed to parse ' + FILENAME)
-            print(
-                FILENAME
-                + " parsing has been completed in {} sec".format(
-                    "{:.3f}".format(time() - file_init_start_time)
-                )
-            )
-    else:
-        if not new_routers:
-            print(
-                "Could not find any valid .txt files with routing tables"
-                + " in {} directory".format(rt_directory)
+    with os.scandir(rt_directory) as it:
+        entries = [
+            entry for entry in it
+            if entry.name.endswith('.txt') and entry.is_file()
+        ]
+    parse_cache = load_parse_cache(PARSE_CACHE_FILE)
+    file_keys = {}
+    for entry in entries:
+        stat = entry.stat()
+        file_keys[entry.path] = (stat.st_mtime_ns, stat.st_size)
+    # Routers restored from parse cache for unchanged files.
+    # None is stored for files which failed to parse.
+    cached_routers = {}
+    for entry in entries:
+        cached = parse_cache.get(entry.path)
+        if cached and cached[0] == file_keys[entry.path]:
+            try:
+                cached_routers[entry.path] = restore_router(*cached[1:])
+            except (ValueError, TypeError):
+                # Malformed cache entry, parse the file again.
+                del parse_cache[entry.path]
+    changed_entries = [
+        entry for entry in entries if entry.path not in cached_routers
+    ]
+    changed_paths = {entry.path for entry in changed_entries}
+    workers = get_parse_worker_count(len(changed_entries))
+    parsed_routers = parse_routing_table_files(
+        [entry.path for entry in changed_entries],
+        [entry.name.replace('.txt', '') for entry in changed_entries],
+        workers,
+    )
+    if workers > 1:
+        # Worker processes parse all changed files at once,
+        # so parsing time is reported for the whole batch instead of per file.
+        parse_start_time = time()
+        parsed_routers = iter(list(parsed_routers))
+        print(
+            "{} files have been parsed by {} worker processes".format(
+                len(changed_entries), workers
             )
+            + " in {} sec".format("{:.3f}".format(time() - parse_start_time))
+        )
+    for entry in entries:
+        FILENAME = entry.name
+        router_id = FILENAME.replace('.txt', '')
+        file_init_start_time = time()
+        if entry.path in changed_paths:
+            print('Opening {}'.format(FILENAME))
+            parse_result = next(parsed_routers)
         else:
-            print(
-                "\nAll files have been initialized"
-                + " in {} sec".format("{:.3f}".format(time() - start_time))
+            print('Loading {} from parse cache'.format(FILENAME))
+            parse_result = cached_routers[entry.path]
+        if parse_result:
+            new_router, interfaces = parse_result
+            register_interfaces(interfaces, router_id)
+            new_routers[router_id] = new_router
+            interfaces_by_rid[router_id] = interfaces
+        else:
+            print('Failed to find routing table entries in given output')
+            print('Failed to parse ' + FILENAME)
+        if workers > 1 and entry.path in changed_paths:
+            continue
+        print(
+            FILENAME
+            + " parsing has been completed in {} sec".format(
+                "{:.3f}".format(time() - file_init_start_time)
+            )
+        )
+    if changed_paths or len(parse_cache) != len(entries):
+        save_parse_cache(
+            PARSE_CACHE_FILE,
+            build_parse_cache(
+                entries, file_keys, new_routers, interfaces_by_rid, parse_cache
             )
-            return new_routers
+        )
+    if not new_routers:
+        print(
+            "Could not find any valid .txt files with routing tables"
+            + " in {} directory".format(rt_directory)
+        )
+    else:
+        print(
+            "\nAll files have been initialized"
+            + " in {} sec".format("{:.3f}".format(time() - start_time))
+        )
+        return new_routers
 
 
 def do_user_interactive_search():
@@ -280,47 +738,58 @@ def do_user_interactive_search():
     """
     while True:
         print('\n')
-        target_subnet = input('Enter Target Subnet or Host: ')
+        target_subnet = input('Enter Target Subnet or Host: ').strip()
         if not target_subnet:
             continue
-        if not REGEXP_INPUT_IPv4.match(target_subnet.replace(' ', '')):
+        if not is_valid_ipv4_cidr(target_subnet):
             print("incorrect input")
             continue
         lookup_start_time = time()
+        # Paths found from transit routers are reused by searches
+        # from the other source routers and by repeated searches.
+        # Whole search output is written at once.
+        output = []
         for rtr in ROUTERS.keys():
             subsearch_start_time = time()
-            result = trace_route(rtr, target_subnet)
+            result = trace_route(rtr, target_subnet, TRACE_CACHE)
             if result:
-                print("\n")
-                print("PATHS TO {} FROM {}".format(target_subnet, rtr))
+                output.extend((
+                    "\n",
+                    "PATHS TO {} FROM {}".format(target_subnet, rtr),
+                    'Detailed info:',
+                ))
                 n = 1
-                print('Detailed info:')
                 for r in result:
-                    print("Path {}:".format(n))
-                    print([h[0] for h in r])
+                    output.append("Path {}:".format(n))
+                    output.append(str([h[0] for h in r]))
                     for hop in r:
-                        print("ROUTER: {}".format(hop[0]))
-                        print("Matched route string: \n{}".format(hop[1]))
+                        output.append("ROUTER: {}".format(hop[0]))
+                        output.append(
+                            "Matched route string: \n{}".format(hop[1])
+                        )
                     else:
-                        print('\n')
+                        output.append('\n')
                     n += 1
                 else:
-                    print(
+                    output.append(
                         "Path search on {} has been completed in {} sec".format(
                            rtr, "{:.3f}".format(time() - subsearch_start_time)
                         )
                     )
         else:
-            print(
+            output.append(
                 "\nFull search has been completed in {} sec".format(
                    "{:.3f}".format(time() - lookup_start_time),
                 )
             )
+            sys.stdout.write("\n".join(output) + "\n")
 
 
 def main():
     global ROUTERS
     ROUTERS = do_parse_directory(RT_DIRECTORY)
+    route_lookup_by_rid.cache_clear()
+    TRACE_CACHE.clear()
     if ROUTERS:
         do_user_interactive_search()
 